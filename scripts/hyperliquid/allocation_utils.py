@@ -0,0 +1,46 @@
+UINT64_MAX = 18446744073709551615  # 2^64 - 1
+ZERO_ADDRESSES = ("0x0000000000000000000000000000000000000000", "0x0")
+
+def parse_user_and_wei(user_and_wei_str):
+    """
+    Parse USER_AND_WEI from string format: "address:amount,address2:amount2"
+
+    :param user_and_wei_str: Raw USER_AND_WEI value
+    :return: List of [address, amount] pairs, address lowercased and amount as string
+    """
+    user_and_wei = []
+    for pair in user_and_wei_str.split(','):
+        if ':' in pair:
+            address, amount = pair.strip().split(':', 1)
+            address = address.strip().lower()
+            amount = amount.strip()
+
+            # Sanity check: no zero address
+            if address in ZERO_ADDRESSES:
+                raise ValueError(f"Zero address not allowed: {address}")
+
+            # Sanity check: amount must be a valid number
+            try:
+                amount_int = int(amount)
+                if amount_int <= 0:
+                    raise ValueError(f"Amount must be positive: {amount}")
+                if amount_int > UINT64_MAX:
+                    raise ValueError(f"Amount exceeds uint64.max ({UINT64_MAX}): {amount}")
+            except ValueError as e:
+                if "exceeds uint64.max" in str(e):
+                    raise e
+                raise ValueError(f"Invalid amount format: {amount}")
+
+            user_and_wei.append([address, amount])
+        else:
+            raise ValueError(f"Invalid USER_AND_WEI format: {pair}")
+    return user_and_wei
+
+def calculate_total_supply(user_and_wei):
+    """
+    Sum the amounts of parsed USER_AND_WEI pairs
+
+    :param user_and_wei: List of [address, amount] pairs
+    :return: Total supply as int
+    """
+    return sum(int(amount) for _, amount in user_and_wei)
@@ -0,0 +1,522 @@
+import requests
+import argparse
+import gc
+import io
+import json
+import msgpack
+import os
+import random
+import re
+import statistics
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Dict, List, Optional, Any
+from unittest import mock
+from eth_account.messages import encode_typed_data
+from hyperliquid.utils import constants
+from hyperliquid.utils.signing import action_hash, construct_phantom_agent, l1_payload
+from hash_utils import iter_msgpack_chunks, streaming_action_hash
+from spot_meta_utils import CHUNK_SIZE, stream_spot_meta
+from signer_utils import LocalSigner, ProcessPoolSigner
+from allocation_utils import parse_user_and_wei, calculate_total_supply
+from getSpotIndex import get_spot_index_and_name
+from writeToDeployments import get_spot_meta, write_deployment
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+RECORDED_DEPLOYMENT_PATH = os.path.join(REPO_ROOT, "deployments", "hypercore-mainnet", "246.json")
+DEFAULT_BASELINE_PATH = os.path.join(os.path.dirname(__file__), "benchmark.baseline.json")
+
+SEED = 246
+# anvil default account, never holds funds
+BENCH_PRIVATE_KEY = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+SIGN_BATCH_SIZE = 5_000
+SPOT_META_SIZE = 10_000
+USER_AND_WEI_SIZES = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+ACTION_HASH_SIZES = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+MEMORY_SLACK_KIB = 64
+
+@dataclass
+class Case:
+    name: str
+    setup: Callable[[], Callable[[], Any]]
+    repeat: int = 5
+    # Called after the case has been measured to release whatever setup created
+    teardown: Optional[Callable[[], None]] = None
+
+def synthetic_spot_meta(size: int = SPOT_META_SIZE) -> Dict[str, Any]:
+    """
+    Build a spotMeta response with `size` tokens and spots.
+
+    The recorded WMNT token from deployments/hypercore-mainnet is placed last so lookups scan the whole universe.
+    """
+    rng = random.Random(SEED)
+    with open(RECORDED_DEPLOYMENT_PATH) as f:
+        recorded = json.load(f)["coreSpot"]
+
+    tokens = []
+    universe = []
+    for i in range(size - 1):
+        tokens.append({
+            "name": f"TKN{i}",
+            "szDecimals": rng.randint(0, 5),
+            "weiDecimals": rng.randint(5, 10),
+            "index": i,
+            "tokenId": "0x" + rng.randbytes(16).hex(),
+            "isCanonical": i < 10,
+            "evmContract": {
+                "address": "0x" + rng.randbytes(20).hex(),
+                "evm_extra_wei_decimals": rng.randint(0, 10),
+            } if rng.random() < 0.2 else None,
+            "fullName": f"Token {i}" if rng.random() < 0.5 else None,
+            "deployerTradingFeeShare": "1.0",
+        })
+        universe.append({"tokens": [i, 0], "name": f"@{i}", "index": i, "isCanonical": i < 10})
+
+    target = dict(recorded, index=size - 1)
+    tokens.append(target)
+    universe.append({"tokens": [target["index"], 0], "name": f"@{size - 1}", "index": size - 1, "isCanonical": False})
+    # Same key order as the API, universe first
+    return {"universe": universe, "tokens": tokens}
+
+def synthetic_user_and_wei(size: int) -> str:
+    """Build a USER_AND_WEI string with `size` address:amount pairs"""
+    rng = random.Random(SEED + size)
+    return ",".join(
+        f"0x{rng.randbytes(20).hex()}:{rng.randint(1, 10**12)}" for _ in range(size)
+    )
+
+def user_genesis_action(size: int) -> Dict[str, Any]:
+    """Build a userGenesis action with `size` userAndWei pairs"""
+    return {
+        "type": "spotDeploy",
+        "userGenesis": {
+            "token": 246,
+            "userAndWei": parse_user_and_wei(synthetic_user_and_wei(size)),
+            "existingTokenAndWei": [],
+        },
+    }
+
+def fake_response(body: bytes) -> requests.Response:
+    """Wrap a recorded body in a requests.Response so the real parsing code path runs"""
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(body)
+    return response
+
+def patched_post(body: bytes):
+    """Patch requests.post to serve a recorded body for every call"""
+    return mock.patch.object(requests, "post", lambda *args, **kwargs: fake_response(body))
+
+def load_spot_meta_body(spot_meta_path: Optional[str]) -> bytes:
+    """Load a recorded spotMeta response, or build a synthetic one"""
+    if spot_meta_path:
+        with open(spot_meta_path, "rb") as f:
+            return f.read()
+    return json.dumps(synthetic_spot_meta()).encode()
+
+def last_token_index(body: bytes) -> int:
+    return json.loads(body)["tokens"][-1]["index"]
+
+def build_cases(spot_meta_path: Optional[str] = None) -> List[Case]:
+    """
+    Build the benchmark cases. Fixtures are generated lazily in each case setup.
+
+    Args:
+        spot_meta_path: Optional recorded spotMeta response to use instead of the synthetic one
+
+    Returns:
+        List of cases
+    """
+    cases = []
+
+    def spot_index_setup():
+        body = load_spot_meta_body(spot_meta_path)
+        token_id = str(last_token_index(body))
+        def run():
+            with patched_post(body):
+                return get_spot_index_and_name(token_id)
+        return run
+
+    def spot_meta_setup():
+        body = load_spot_meta_body(spot_meta_path)
+        token_index = last_token_index(body)
+        def run():
+            with patched_post(body):
+                return get_spot_meta(token_index)
+        return run
+
+    def full_decode_setup():
+        body = load_spot_meta_body(spot_meta_path)
+        token_index = last_token_index(body)
+        def run():
+            data = fake_response(body).json()
+            spot = next(spot for spot in data["universe"] if spot["tokens"] == [token_index, 0])
+            token = next(token for token in data["tokens"] if token["index"] == token_index)
+            return spot, token
+        return run
+
+    def stream_decode_setup(first=False):
+        body = load_spot_meta_body(spot_meta_path)
+        token_index = json.loads(body)["tokens"][0]["index"] if first else last_token_index(body)
+        def run():
+            return stream_spot_meta(fake_response(body).iter_content(CHUNK_SIZE), token_indexes=[token_index])
+        return run
+
+    cases.append(Case("get_spot_index_and_name/spotMeta_10k", spot_index_setup))
+    cases.append(Case("get_spot_meta/spotMeta_10k", spot_meta_setup))
+    cases.append(Case("spot_meta_full_decode/last_token", full_decode_setup))
+    cases.append(Case("spot_meta_stream_decode/last_token", stream_decode_setup))
+    cases.append(Case("spot_meta_stream_decode/first_token", partial(stream_decode_setup, first=True)))
+
+    for label, size in USER_AND_WEI_SIZES.items():
+        def parse_setup(size=size):
+            user_and_wei_str = synthetic_user_and_wei(size)
+            return lambda: parse_user_and_wei(user_and_wei_str)
+
+        def total_supply_setup(size=size):
+            user_and_wei = parse_user_and_wei(synthetic_user_and_wei(size))
+            return lambda: calculate_total_supply(user_and_wei)
+
+        repeat = 3 if size >= 1_000_000 else 5
+        cases.append(Case(f"parse_user_and_wei/{label}", parse_setup, repeat))
+        cases.append(Case(f"calculate_total_supply/{label}", total_supply_setup, repeat))
+
+    for label, size in ACTION_HASH_SIZES.items():
+        repeat = 3 if size >= 1_000_000 else 5
+        cases.append(Case(
+            f"action_hash/userGenesis_{label}",
+            lambda size=size: partial(action_hash, user_genesis_action(size), None, 1700000000000, None),
+            repeat,
+        ))
+        cases.append(Case(
+            f"streaming_action_hash/userGenesis_{label}",
+            lambda size=size: partial(streaming_action_hash, user_genesis_action(size), None, 1700000000000, None),
+            repeat,
+        ))
+
+    def encode_typed_data_setup():
+        hash = action_hash({"type": "spotDeploy", "registerSpot": {"tokens": [246, 0]}}, None, 1700000000000, None)
+        data = l1_payload(construct_phantom_agent(hash, True))
+        def run():
+            for _ in range(1000):
+                encode_typed_data(full_message=data)
+        return run
+
+    cases.append(Case("encode_typed_data/x1000", encode_typed_data_setup))
+
+    def signing_digests():
+        rng = random.Random(SEED)
+        domain_hash = encode_typed_data(full_message=l1_payload(construct_phantom_agent(b"\x00" * 32, True))).header
+        return [(domain_hash, rng.randbytes(32)) for _ in range(SIGN_BATCH_SIZE)]
+
+    def local_signer_setup():
+        digests = signing_digests()
+        signer = LocalSigner(BENCH_PRIVATE_KEY)
+        return lambda: signer.sign_typed_data_batch(digests)
+
+    pool_signers = []
+
+    def process_pool_signer_setup():
+        digests = signing_digests()
+        # The pool is started here so its startup cost stays out of the timings
+        signer = ProcessPoolSigner(BENCH_PRIVATE_KEY)
+        pool_signers.append(signer)
+        return lambda: signer.sign_typed_data_batch(digests)
+
+    cases.append(Case("local_signer/x5k", local_signer_setup, 3))
+    cases.append(Case(
+        "process_pool_signer/x5k", process_pool_signer_setup, 3, teardown=lambda: pool_signers.pop().close()
+    ))
+
+    temp_dirs = []
+
+    def write_deployment_setup():
+        with open(RECORDED_DEPLOYMENT_PATH) as f:
+            output_data = json.load(f)
+        temp_dir = tempfile.TemporaryDirectory(prefix="hl-bench-")
+        temp_dirs.append(temp_dir)
+        output_path = os.path.join(temp_dir.name, "deployments", "hypercore-mainnet", "246.json")
+        def run():
+            for _ in range(100):
+                write_deployment(output_data, output_path, pretty=True)
+        return run
+
+    cases.append(Case("write_deployment/x100", write_deployment_setup, teardown=lambda: temp_dirs.pop().cleanup()))
+    return cases
+
+def random_msgpack_value(rng: random.Random, depth: int = 0) -> Any:
+    """Build a random msgpack-encodable value, biased towards the shapes and sizes used by L1 actions"""
+    kind = rng.randrange(9 if depth < 3 else 6)
+    if kind == 0:
+        return rng.randint(-2**63, 2**64 - 1)
+    if kind == 1:
+        return "".join(rng.choice("0xabcdefé") for _ in range(rng.choice([0, 5, 31, 32, 255, 256, 70_000])))
+    if kind == 2:
+        return rng.choice([True, False, None])
+    if kind == 3:
+        return rng.uniform(-1e18, 1e18)
+    if kind == 4:
+        return rng.randbytes(rng.choice([0, 10, 255, 256, 70_000]))
+    if kind == 5:
+        return rng.randint(0, 300)
+    if kind == 6:
+        size = rng.choice([0, 3, 16, 17, 255, 256, 20_000 if depth == 0 else 40])
+        if depth == 0:
+            return [[f"0x{rng.randbytes(20).hex()}", str(rng.randint(1, 2**64 - 1))] for _ in range(size)]
+        return [random_msgpack_value(rng, depth + 1) for _ in range(size)]
+    if kind == 7:
+        return {f"key{i}": random_msgpack_value(rng, depth + 1) for i in range(rng.choice([0, 2, 16, 17, 40]))}
+    return tuple(random_msgpack_value(rng, depth + 1) for _ in range(rng.choice([2, 20])))
+
+def verify_streaming_action_hash(rounds: int, seed: int = SEED) -> None:
+    """
+    Check streaming_action_hash against the SDK action_hash on randomized actions.
+
+    Args:
+        rounds: Number of random actions to check
+        seed: Random seed, printed on failure so it can be reproduced
+    """
+    rng = random.Random(seed)
+    for i in range(rounds):
+        action = {"type": "spotDeploy", "payload": random_msgpack_value(rng)}
+        vault_address = rng.choice([None, "0x" + rng.randbytes(20).hex()])
+        expires_after = rng.choice([None, rng.randint(0, 2**64 - 1)])
+        nonce = rng.randint(0, 2**64 - 1)
+        if b"".join(iter_msgpack_chunks(action)) != msgpack.packb(action):
+            raise AssertionError(f"msgpack encoding mismatch in round {i} (seed {seed})")
+        expected = action_hash(action, vault_address, nonce, expires_after)
+        if streaming_action_hash(action, vault_address, nonce, expires_after) != expected:
+            raise AssertionError(f"action hash mismatch in round {i} (seed {seed})")
+    print(f"streaming_action_hash matches action_hash on {rounds} random actions (seed {seed})")
+
+def random_spot_meta_body(rng: random.Random) -> bytes:
+    """
+    Build a small spotMeta body with randomized key order, formatting and non-ASCII names
+
+    Extra top-level keys with numbers, strings and deeply nested arrays exercise the paths that skip unknown values,
+    and sections without targets are skipped as well.
+    """
+    size = rng.choice([0, 1, 50, 300])
+    names = ["MNT", "WMNT", "é", "中文", "🚀"]
+    tokens = []
+    universe = []
+    for i in range(size):
+        token = {
+            "name": rng.choice(names) + str(i),
+            "szDecimals": rng.randint(0, 5),
+            "weiDecimals": rng.randint(5, 10),
+            "index": i,
+            "tokenId": "0x" + rng.randbytes(16).hex(),
+            "isCanonical": rng.random() < 0.1,
+            "evmContract": {"address": "0x" + rng.randbytes(20).hex(), "evm_extra_wei_decimals": 10} if rng.random() < 0.2 else None,
+            "fullName": rng.choice([None, "Mantle ]}, \"quoted\"", "back\\slash\\", "🚀 " * 3]),
+            "deployerTradingFeeShare": rng.choice(["1.0", "0.0"]),
+        }
+        spot = {"tokens": [i, rng.choice([0, 0, 0, rng.randrange(max(size, 1))])], "name": f"@{i}", "index": i, "isCanonical": False}
+        tokens.append(dict(rng.sample(list(token.items()), len(token))))
+        universe.append(dict(rng.sample(list(spot.items()), len(spot))))
+
+    meta = {"universe": universe, "tokens": tokens}
+    if rng.random() < 0.5:
+        meta["extra"] = [1, -2.5e-3, "x}]", {"a": [1, 2]}, None, True, [[[[[[{"deep": ["\\\"]"]}]]]]]]]
+        meta["number"] = rng.choice([0, -1.5e3, 12345678901234567890, 1e-7])
+    meta = dict(rng.sample(list(meta.items()), len(meta)))
+    text = json.dumps(
+        meta,
+        indent=rng.choice([None, 0, 1, 4]),
+        ensure_ascii=rng.random() < 0.3,
+        separators=rng.choice([None, (",", ":"), (" , ", " : ")]),
+    )
+    return text.encode()
+
+def verify_stream_spot_meta(rounds: int, seed: int = SEED) -> None:
+    """
+    Check stream_spot_meta against filtering the json.loads decode on randomized spotMeta bodies.
+
+    Bodies are split into tiny chunks so tokens, numbers and multi-byte UTF-8 characters straddle chunk
+    boundaries, and some targets are missing so the whole body is read.
+
+    Args:
+        rounds: Number of random bodies to check
+        seed: Random seed, printed on failure so it can be reproduced
+    """
+    rng = random.Random(seed)
+    for i in range(rounds):
+        body = random_spot_meta_body(rng)
+        data = json.loads(body)
+        size = len(data["tokens"])
+
+        # Targets in range may or may not exist, the ones past the end never do
+        token_indexes = [rng.randrange(size + 5) for _ in range(rng.randint(0, 3))]
+        token_ids = [rng.choice([t["tokenId"] for t in data["tokens"]] + ["0x" + rng.randbytes(16).hex()]) for _ in range(rng.randint(0, 2))]
+        token_ids = [token_id.upper() if rng.random() < 0.5 else token_id for token_id in token_ids]
+        spot_indexes = [rng.randrange(size + 5) for _ in range(rng.randint(0, 2))]
+        pairs = [(rng.randrange(size + 5), rng.choice([0, 99])) for _ in range(rng.randint(0, 2))]
+
+        chunk_size = rng.choice([1, 2, 3, 4, 5, 6, 7, 64, CHUNK_SIZE])
+        chunks = [body[j:j + chunk_size] for j in range(0, len(body), chunk_size)]
+        try:
+            result = stream_spot_meta(chunks, token_indexes, token_ids, spot_indexes, pairs)
+        except ValueError as e:
+            raise AssertionError(f"stream_spot_meta failed in round {i} (seed {seed}, chunk size {chunk_size}): {e}") from e
+
+        wanted_ids = {token_id.lower() for token_id in token_ids}
+        expected = {
+            "tokens": [t for t in data["tokens"] if t["index"] in token_indexes or t["tokenId"].lower() in wanted_ids],
+            "universe": [s for s in data["universe"] if s["index"] in spot_indexes or tuple(s["tokens"]) in set(pairs)],
+        }
+        if result != expected:
+            raise AssertionError(f"stream_spot_meta mismatch in round {i} (seed {seed}, chunk size {chunk_size})")
+    print(f"stream_spot_meta matches json.loads on {rounds} random spotMeta bodies (seed {seed})")
+
+def measure(case: Case, measure_memory: bool = True) -> Dict[str, Any]:
+    """
+    Time a case and optionally record its peak traced memory.
+
+    Args:
+        case: Case to run
+        measure_memory: Whether to run once more under tracemalloc
+
+    Returns:
+        Result dictionary with min/median/mean seconds and peak memory in KiB
+    """
+    run = case.setup()
+    try:
+        run()  # warm up
+
+        timings = []
+        for _ in range(case.repeat):
+            gc.collect()
+            started = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - started)
+
+        result = {
+            "repeat": case.repeat,
+            "min": min(timings),
+            "median": statistics.median(timings),
+            "mean": statistics.mean(timings),
+        }
+        if measure_memory:
+            gc.collect()
+            tracemalloc.start()
+            run()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            result["peak_kib"] = peak // 1024
+        return result
+    finally:
+        if case.teardown:
+            case.teardown()
+
+def compare(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    threshold: float,
+    memory_threshold: float,
+) -> List[str]:
+    """
+    Compare results against a baseline.
+
+    Args:
+        results: Current results by case name
+        baseline: Baseline results by case name
+        threshold: Allowed relative slowdown of the median, e.g. 0.25 for 25%
+        memory_threshold: Allowed relative growth of the peak memory, e.g. 0.25 for 25%
+
+    Returns:
+        List of regression descriptions, empty if none
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            print(f"{name}: no baseline")
+            continue
+        ratio = result["median"] / base["median"] if base["median"] else float("inf")
+        status = "REGRESSED" if ratio > 1 + threshold else "ok"
+        print(f"{name}: {base['median'] * 1000:.2f}ms -> {result['median'] * 1000:.2f}ms ({ratio:.2f}x) {status}")
+        if status == "REGRESSED":
+            regressions.append(f"{name} {ratio:.2f}x slower than baseline")
+
+        if "peak_kib" in result and "peak_kib" in base:
+            growth = result["peak_kib"] - base["peak_kib"]
+            # Tiny peaks are dominated by allocator noise, require an absolute growth as well
+            memory_status = "ok"
+            if growth > MEMORY_SLACK_KIB and result["peak_kib"] > base["peak_kib"] * (1 + memory_threshold):
+                memory_status = "REGRESSED"
+                regressions.append(f"{name} peak memory {base['peak_kib']}KiB -> {result['peak_kib']}KiB")
+            print(f"{name}: peak {base['peak_kib']}KiB -> {result['peak_kib']}KiB {memory_status}")
+
+    for name in baseline:
+        if name not in results:
+            print(f"{name}: in baseline but not run")
+    return regressions
+
+def record_spot_meta(output_path: str, is_testnet: bool = False) -> None:
+    """Record a live spotMeta response to use as a fixture"""
+    api_url = constants.TESTNET_API_URL if is_testnet else constants.MAINNET_API_URL
+    response = requests.post(api_url + "/info", json={"type": "spotMeta"})
+    response.raise_for_status()
+    with open(output_path, "wb") as f:
+        f.write(response.content)
+    print(f"spotMeta recorded to {output_path}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the Hyperliquid scripts on mainnet-scale fixtures')
+    parser.add_argument('--filter', type=str, default=None, help='Only run cases whose name matches this regex')
+    parser.add_argument('--spot-meta', type=str, default=None, metavar='PATH', help='Use a recorded spotMeta response instead of the synthetic 10k fixture')
+    parser.add_argument('--record-spot-meta', type=str, default=None, metavar='PATH', help='Record a live spotMeta response to PATH and exit')
+    parser.add_argument('--testnet', action='store_true', help='Use testnet API when recording (default: mainnet)')
+    parser.add_argument('--save', nargs='?', const=DEFAULT_BASELINE_PATH, metavar='PATH', help='Save results as a JSON baseline')
+    parser.add_argument('--compare', nargs='?', const=DEFAULT_BASELINE_PATH, metavar='PATH', help='Compare results against a JSON baseline')
+    parser.add_argument('--threshold', type=float, default=0.25, help='Allowed relative slowdown before a case counts as regressed')
+    parser.add_argument('--memory-threshold', type=float, default=0.25, help='Allowed relative peak memory growth before a case counts as regressed')
+    parser.add_argument('--verify-hash', type=int, default=None, metavar='ROUNDS', help='Check streaming_action_hash against the SDK action_hash on ROUNDS random actions and exit')
+    parser.add_argument('--verify-spot-meta', type=int, default=None, metavar='ROUNDS', help='Check stream_spot_meta against a full json.loads decode on ROUNDS random spotMeta bodies and exit')
+    parser.add_argument('--seed', type=int, default=SEED, help='Random seed for --verify-hash and --verify-spot-meta')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the tracemalloc peak memory run')
+
+    args = parser.parse_args()
+
+    if args.verify_hash is not None:
+        verify_streaming_action_hash(args.verify_hash, args.seed)
+        return
+
+    if args.verify_spot_meta is not None:
+        verify_stream_spot_meta(args.verify_spot_meta, args.seed)
+        return
+
+    if args.record_spot_meta:
+        record_spot_meta(args.record_spot_meta, args.testnet)
+        return
+
+    results = {}
+    for case in build_cases(args.spot_meta):
+        if args.filter and not re.search(args.filter, case.name):
+            continue
+        result = measure(case, not args.no_memory)
+        results[case.name] = result
+        peak = f" peak {result['peak_kib']}KiB" if "peak_kib" in result else ""
+        print(f"{case.name}: median {result['median'] * 1000:.2f}ms min {result['min'] * 1000:.2f}ms{peak}")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nBaseline written to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print()
+        regressions = compare(results, baseline, args.threshold, args.memory_threshold)
+        if regressions:
+            for regression in regressions:
+                print(f"Regression: {regression}")
+            exit(1)
+
+if __name__ == "__main__":
+    main()
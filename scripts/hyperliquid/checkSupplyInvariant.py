@@ -0,0 +1,329 @@
+import requests
+import argparse
+import json
+import os
+import sys
+import time
+import tomllib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Dict, List, Optional, Any
+from dotenv import load_dotenv
+from hyperliquid.utils import constants
+
+# Load environment variables from .env file
+load_dotenv()
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+DEPLOYMENT_JSON_PATH = os.path.join(REPO_ROOT, "scripts", "foundry", "oft.deployment.json")
+CONFIG_TOML_PATH = os.path.join(REPO_ROOT, "scripts", "foundry", "oft.config.{network}.toml")
+HYPERCORE_DEPLOYMENT_PATH = os.path.join(REPO_ROOT, "deployments", "hypercore-{network}", "{index}.json")
+
+FOUNDRY_TOML_PATH = os.path.join(REPO_ROOT, "foundry.toml")
+# foundry.toml profiles not named <chain>-<network>
+FOUNDRY_PROFILE_ALIASES = {"eth-testnet": "sepolia"}
+
+# The chain holding the OFT adapter, every other chain in the mesh mints
+HOME_CHAIN = "eth"
+# The chain linked with HyperCore through evmContract
+HYPER_CHAIN = "hyper"
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+BALANCE_OF_SELECTOR = "0x70a08231"
+TOTAL_SUPPLY_SELECTOR = "0x18160ddd"
+
+@dataclass
+class ChainSnapshot:
+    chain: str
+    block_number: int
+    block_timestamp: int
+    values: Dict[str, int] = field(default_factory=dict)
+
+@dataclass
+class CoreSnapshot:
+    token_index: int
+    fetched_at: int
+    total_supply: Decimal
+    bridge_balance: Decimal
+
+def asset_bridge_address(token_index: int) -> str:
+    """
+    Get the HyperCore system address that bridges a spot token with its evmContract.
+
+    Args:
+        token_index: Core spot token index
+
+    Returns:
+        Address of the form 0x20...<token_index>
+    """
+    return "0x20" + format(token_index, "x").rjust(38, "0")
+
+def encode_call(selector: str, address: Optional[str] = None) -> str:
+    """Encode calldata for a selector with an optional single address argument"""
+    if address is None:
+        return selector
+    return selector + address.lower().removeprefix("0x").rjust(64, "0")
+
+def rpc_batch(rpc_url: str, calls: List[Dict[str, Any]], timeout: float) -> List[Any]:
+    """
+    Send a JSON-RPC batch and return the results in request order.
+
+    Args:
+        rpc_url: JSON-RPC endpoint
+        calls: List of {"method", "params"} dicts
+        timeout: Request timeout in seconds
+
+    Returns:
+        List of results, one per call
+    """
+    batch = [{"jsonrpc": "2.0", "id": i, "method": c["method"], "params": c["params"]} for i, c in enumerate(calls)]
+    response = requests.post(rpc_url, json=batch, timeout=timeout)
+    response.raise_for_status()
+    replies = response.json()
+    if not isinstance(replies, list):
+        replies = [replies]
+    results = {}
+    for reply in replies:
+        if "error" in reply:
+            raise ValueError(f"RPC error from {rpc_url}: {reply['error']}")
+        results[reply["id"]] = reply["result"]
+    return [results[i] for i in range(len(calls))]
+
+def snapshot_chain(chain: str, rpc_url: str, reads: Dict[str, Dict[str, str]], timeout: float) -> ChainSnapshot:
+    """
+    Read a set of eth_call values from one chain, all pinned to the same block.
+
+    Args:
+        chain: Chain name as used in oft.config.*.toml
+        rpc_url: JSON-RPC endpoint for the chain
+        reads: Mapping of label -> {"to", "data"}
+        timeout: Request timeout in seconds
+
+    Returns:
+        ChainSnapshot with the block number, block timestamp and decoded values
+    """
+    block = rpc_batch(rpc_url, [{"method": "eth_getBlockByNumber", "params": ["latest", False]}], timeout)[0]
+    block_number = block["number"]
+    labels = list(reads.keys())
+    calls = [{"method": "eth_call", "params": [reads[label], block_number]} for label in labels]
+    results = rpc_batch(rpc_url, calls, timeout) if calls else []
+    return ChainSnapshot(
+        chain=chain,
+        block_number=int(block_number, 16),
+        block_timestamp=int(block["timestamp"], 16),
+        values={label: int(result, 16) for label, result in zip(labels, results)},
+    )
+
+def snapshot_core(token_index: int, token_id: str, is_testnet: bool, timeout: float) -> CoreSnapshot:
+    """
+    Read the Core-side total supply and the asset bridge balance of a spot token.
+
+    Args:
+        token_index: Core spot token index
+        token_id: Core spot tokenId
+        is_testnet: Whether to use testnet API
+        timeout: Request timeout in seconds
+
+    Returns:
+        CoreSnapshot with amounts in token units
+    """
+    api_url = constants.TESTNET_API_URL if is_testnet else constants.MAINNET_API_URL
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        details_future = executor.submit(
+            requests.post, api_url + "/info", json={"type": "tokenDetails", "tokenId": token_id}, timeout=timeout
+        )
+        state_future = executor.submit(
+            requests.post, api_url + "/info",
+            json={"type": "spotClearinghouseState", "user": asset_bridge_address(token_index)}, timeout=timeout
+        )
+        details_response = details_future.result()
+        state_response = state_future.result()
+    fetched_at = int(time.time())
+    details_response.raise_for_status()
+    state_response.raise_for_status()
+
+    total_supply = Decimal(details_response.json()["totalSupply"])
+    balance = next((b for b in state_response.json().get("balances", []) if b["token"] == token_index), None)
+    bridge_balance = Decimal(balance["total"]) if balance else Decimal(0)
+    return CoreSnapshot(
+        token_index=token_index,
+        fetched_at=fetched_at,
+        total_supply=total_supply,
+        bridge_balance=bridge_balance,
+    )
+
+def load_mesh(is_testnet: bool) -> Dict[str, Any]:
+    """
+    Load the OFT mesh from oft.config.*.toml, oft.deployment.json and the HyperCore deployment file.
+
+    Args:
+        is_testnet: Whether to load the testnet mesh
+
+    Returns:
+        Dictionary with mnt, oft addresses per chain and the HyperCore token info
+    """
+    network = "testnet" if is_testnet else "mainnet"
+    with open(CONFIG_TOML_PATH.format(network=network), "rb") as f:
+        config = tomllib.load(f)
+    with open(DEPLOYMENT_JSON_PATH) as f:
+        deployment = json.load(f)
+
+    # Every chain with a LayerZero config and a deployed OFT is part of the mesh
+    ofts = {}
+    for chain in config.get("lz", {}):
+        address = deployment["oft"].get(chain, {}).get(network, ZERO_ADDRESS)
+        if address.lower() != ZERO_ADDRESS:
+            ofts[chain] = address
+    if HOME_CHAIN not in ofts:
+        raise ValueError(f"OFT adapter on {HOME_CHAIN} not found in {DEPLOYMENT_JSON_PATH}")
+
+    composer = config.get("deploy", {}).get("hyperliquid_composer", {})
+    core = None
+    if HYPER_CHAIN in ofts and "core_index_id" in composer:
+        token_index = composer["core_index_id"]
+        with open(HYPERCORE_DEPLOYMENT_PATH.format(network=network, index=token_index)) as f:
+            core_spot = json.load(f)["coreSpot"]
+        # Fall back to the composer config until the evmContract link is finalized
+        evm_contract = core_spot.get("evmContract")
+        extra_decimals = evm_contract["evm_extra_wei_decimals"] if evm_contract else composer["asset_decimal_diff"]
+        core = {
+            "index": token_index,
+            "tokenId": core_spot["tokenId"],
+            "weiDecimals": core_spot["weiDecimals"],
+            "evm_extra_wei_decimals": extra_decimals,
+        }
+
+    return {"mnt": config["mnt"], "ofts": ofts, "core": core}
+
+def rpc_url_for(chain: str, is_testnet: bool) -> str:
+    """
+    Get the RPC URL of a chain, preferring <CHAIN>_RPC_URL from the environment over the foundry.toml profile.
+
+    Args:
+        chain: Chain name as used in oft.config.*.toml, e.g. "eth"
+        is_testnet: Whether to use the testnet profile
+
+    Returns:
+        JSON-RPC endpoint for the chain
+    """
+    env_var = f"{chain.upper()}_RPC_URL"
+    if os.getenv(env_var):
+        return os.getenv(env_var)
+    network = "testnet" if is_testnet else "mainnet"
+    profile = f"{chain}-{network}"
+    profile = FOUNDRY_PROFILE_ALIASES.get(profile, profile)
+    with open(FOUNDRY_TOML_PATH, "rb") as f:
+        profiles = tomllib.load(f).get("profile", {})
+    rpc_url = profiles.get(profile, {}).get("eth_rpc_url")
+    if not rpc_url:
+        raise ValueError(
+            f"No RPC URL for chain {chain} on {network}: set {env_var} or eth_rpc_url in [profile.{profile}] of foundry.toml"
+        )
+    return rpc_url
+
+def check_supply(is_testnet: bool = False, timeout: float = 5.0) -> Dict[str, Any]:
+    """
+    Snapshot every chain of the OFT mesh and HyperCore concurrently and compute the supply drift.
+
+    Two invariants are checked, all amounts in EVM wei (18 decimals):
+      - mesh: MNT locked in the L1 adapter == sum of OFT totalSupply on every peer
+      - core: OFT balance of the asset bridge on HyperEVM == Core supply outside the asset bridge
+
+    Args:
+        is_testnet: Whether to check the testnet mesh
+        timeout: Per-request timeout in seconds
+
+    Returns:
+        Report dictionary with pinned snapshots and drift per invariant
+    """
+    mesh = load_mesh(is_testnet)
+    core = mesh["core"]
+
+    reads = {}
+    for chain, oft in mesh["ofts"].items():
+        if chain == HOME_CHAIN:
+            reads[chain] = {"locked": {"to": mesh["mnt"], "data": encode_call(BALANCE_OF_SELECTOR, oft)}}
+        else:
+            reads[chain] = {"minted": {"to": oft, "data": encode_call(TOTAL_SUPPLY_SELECTOR)}}
+    if core:
+        reads[HYPER_CHAIN]["bridged"] = {
+            "to": mesh["ofts"][HYPER_CHAIN],
+            "data": encode_call(BALANCE_OF_SELECTOR, asset_bridge_address(core["index"])),
+        }
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=len(reads) + 1) as executor:
+        chain_futures = {
+            chain: executor.submit(snapshot_chain, chain, rpc_url_for(chain, is_testnet), chain_reads, timeout)
+            for chain, chain_reads in reads.items()
+        }
+        core_future = executor.submit(
+            snapshot_core, core["index"], core["tokenId"], is_testnet, timeout
+        ) if core else None
+        snapshots = {chain: future.result() for chain, future in chain_futures.items()}
+        core_snapshot = core_future.result() if core_future else None
+    elapsed = time.monotonic() - started
+
+    locked = snapshots[HOME_CHAIN].values["locked"]
+    minted = {chain: s.values["minted"] for chain, s in snapshots.items() if chain != HOME_CHAIN}
+    report = {
+        "network": "testnet" if is_testnet else "mainnet",
+        "elapsedSeconds": round(elapsed, 3),
+        "chains": {
+            chain: {"block": s.block_number, "timestamp": s.block_timestamp, **{k: str(v) for k, v in s.values.items()}}
+            for chain, s in snapshots.items()
+        },
+        "mesh": {
+            "locked": str(locked),
+            "minted": str(sum(minted.values())),
+            "drift": str(sum(minted.values()) - locked),
+        },
+    }
+
+    if core_snapshot:
+        # Core amounts are decimal token units, scale to Core wei then to EVM wei
+        scale = Decimal(10) ** (core["weiDecimals"] + core["evm_extra_wei_decimals"])
+        circulating = int((core_snapshot.total_supply - core_snapshot.bridge_balance) * scale)
+        bridged = snapshots[HYPER_CHAIN].values["bridged"]
+        report["core"] = {
+            "index": core["index"],
+            "fetchedAt": core_snapshot.fetched_at,
+            "circulating": str(circulating),
+            "bridged": str(bridged),
+            "drift": str(circulating - bridged),
+        }
+
+    timestamps = [s.block_timestamp for s in snapshots.values()]
+    if core_snapshot:
+        timestamps.append(core_snapshot.fetched_at)
+    report["skewSeconds"] = max(timestamps) - min(timestamps)
+    return report
+
+def main():
+    parser = argparse.ArgumentParser(description='Check that MNT locked on L1 matches the supply minted across the OFT mesh and HyperCore')
+    parser.add_argument('--testnet', action='store_true', help='Check the testnet mesh (default: mainnet)')
+    parser.add_argument('--tolerance', type=int, default=0, help='Allowed absolute drift in wei, e.g. to absorb in-flight LayerZero messages')
+    parser.add_argument('--timeout', type=float, default=5.0, help='Per-request timeout in seconds')
+    parser.add_argument('--pretty', action='store_true', help='Pretty print JSON output')
+
+    args = parser.parse_args()
+
+    try:
+        report = check_supply(args.testnet, args.timeout)
+    except Exception as e:
+        print(f"Error: {e}")
+        exit(2)
+
+    drifts = [int(report["mesh"]["drift"])]
+    if "core" in report:
+        drifts.append(int(report["core"]["drift"]))
+    report["ok"] = all(abs(drift) <= args.tolerance for drift in drifts)
+
+    print(json.dumps(report, indent=2 if args.pretty else None))
+    if not report["ok"]:
+        print("Supply invariant violated", file=sys.stderr)
+        exit(1)
+
+if __name__ == "__main__":
+    main()
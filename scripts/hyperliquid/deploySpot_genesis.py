@@ -5,6 +5,7 @@ from dotenv import load_dotenv
 from hyperliquid.utils import constants
 from hyperliquid.utils.signing import get_timestamp_ms
 from ledger_utils import ledger_sign_l1_action
+from allocation_utils import parse_user_and_wei, calculate_total_supply
 from ledgereth import accounts
 
 # Load environment variables from .env file
@@ -23,45 +24,16 @@ if not USER_AND_WEI_STR:
 
 # Parse USER_AND_WEI and calculate total supply
 try:
-    total_supply = 0
-    uint64_max = 18446744073709551615  # 2^64 - 1
-    
-    for pair in USER_AND_WEI_STR.split(','):
-        if ':' in pair:
-            address, amount = pair.strip().split(':', 1)
-            address = address.strip().lower()
-            amount = amount.strip()
-            
-            # Sanity check: no zero address
-            if address == "0x0000000000000000000000000000000000000000" or address == "0x0":
-                raise ValueError(f"Zero address not allowed: {address}")
-            
-            # Sanity check: amount must be a valid number
-            try:
-                amount_int = int(amount)
-                if amount_int <= 0:
-                    raise ValueError(f"Amount must be positive: {amount}")
-                if amount_int > uint64_max:
-                    raise ValueError(f"Amount exceeds uint64.max ({uint64_max}): {amount}")
-                
-                # Accumulate total supply
-                total_supply += amount_int
-                
-            except ValueError as e:
-                if "exceeds uint64.max" in str(e):
-                    raise e
-                raise ValueError(f"Invalid amount format: {amount}")
-        else:
-            raise ValueError(f"Invalid USER_AND_WEI format: {pair}")
+    user_and_wei = parse_user_and_wei(USER_AND_WEI_STR)
+    total_supply = calculate_total_supply(user_and_wei)
     
     if total_supply == 0:
         raise ValueError("Total supply cannot be zero")
     
     # Print parsed data and calculated total supply
     print("Parsed USER_AND_WEI:")
-    for i, pair in enumerate(USER_AND_WEI_STR.split(',')):
-        address, amount = pair.strip().split(':', 1)
-        print(f"  User {i+1}: {address.strip().lower()} -> {amount.strip()}")
+    for i, (address, amount) in enumerate(user_and_wei):
+        print(f"  User {i+1}: {address} -> {amount}")
     print(f"Calculated maxSupply: {total_supply}")
     print()
         
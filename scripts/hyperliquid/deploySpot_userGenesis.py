@@ -3,6 +3,7 @@ import argparse
 from hyperliquid.utils import constants
 from hyperliquid.utils.signing import get_timestamp_ms
 from ledger_utils import ledger_sign_l1_action
+from allocation_utils import parse_user_and_wei
 from ledgereth import accounts
 import os
 from dotenv import load_dotenv
@@ -23,34 +24,7 @@ if not USER_AND_WEI_STR:
 
 # Parse USER_AND_WEI from string format: "address:amount,address2:amount2"
 try:
-    user_and_wei = []
-    uint64_max = 18446744073709551615  # 2^64 - 1
-    
-    for pair in USER_AND_WEI_STR.split(','):
-        if ':' in pair:
-            address, amount = pair.strip().split(':', 1)
-            address = address.strip().lower()
-            amount = amount.strip()
-            
-            # Sanity check: no zero address
-            if address == "0x0000000000000000000000000000000000000000" or address == "0x0":
-                raise ValueError(f"Zero address not allowed: {address}")
-            
-            # Sanity check: amount must be a valid number
-            try:
-                amount_int = int(amount)
-                if amount_int <= 0:
-                    raise ValueError(f"Amount must be positive: {amount}")
-                if amount_int > uint64_max:
-                    raise ValueError(f"Amount exceeds uint64.max ({uint64_max}): {amount}")
-            except ValueError as e:
-                if "exceeds uint64.max" in str(e):
-                    raise e
-                raise ValueError(f"Invalid amount format: {amount}")
-            
-            user_and_wei.append([address, amount])
-        else:
-            raise ValueError(f"Invalid USER_AND_WEI format: {pair}")
+    user_and_wei = parse_user_and_wei(USER_AND_WEI_STR)
     
     if not user_and_wei:
         raise ValueError("USER_AND_WEI must contain at least one address:amount pair")
@@ -2,6 +2,7 @@ import requests
 import argparse
 import json
 from hyperliquid.utils import constants
+from spot_meta_utils import CHUNK_SIZE, stream_spot_meta
 
 def get_spot_index_and_name(token_id: str, is_testnet: bool = False) -> tuple[int, str]:
     """
@@ -14,6 +15,11 @@ def get_spot_index_and_name(token_id: str, is_testnet: bool = False) -> tuple[in
     Returns:
         Tuple of (spot_index, token_name)
     """
+    try:
+        token_index = int(token_id)
+    except ValueError:
+        raise ValueError(f"Token ID {token_id} is not a token index, expected an integer")
+
     payload = {
         "type": "spotMeta",
     }
@@ -22,9 +28,14 @@ def get_spot_index_and_name(token_id: str, is_testnet: bool = False) -> tuple[in
     api_url = constants.TESTNET_API_URL if is_testnet else constants.MAINNET_API_URL
     
     try:
-        response = requests.post(api_url + "/info", json=payload)
-        response.raise_for_status()
-        data = response.json()
+        # Stream the body and only decode the spot pair and token we are looking for
+        with requests.post(api_url + "/info", json=payload, stream=True) as response:
+            response.raise_for_status()
+            data = stream_spot_meta(
+                response.iter_content(CHUNK_SIZE),
+                token_indexes=[token_index],
+                pairs=[(token_index, 0)],
+            )
         
         # The response has a 'universe' field containing an array of spot structures
         universe = data.get("universe", [])
@@ -34,7 +45,7 @@ def get_spot_index_and_name(token_id: str, is_testnet: bool = False) -> tuple[in
         for spot in universe:
             if spot.get("tokens") and len(spot["tokens"]) >= 2:
                 # Check if the first token matches our token ID
-                if str(spot["tokens"][0]) == token_id and str(spot["tokens"][1]) == "0":
+                if spot["tokens"][0] == token_index and spot["tokens"][1] == 0:
                     spot_index = spot["index"]
                     break
         
@@ -45,7 +56,7 @@ def get_spot_index_and_name(token_id: str, is_testnet: bool = False) -> tuple[in
         tokens_data = data.get("tokens", [])
         
         # Find specific token by index to get the name
-        token_data = next((token for token in tokens_data if token["index"] == int(token_id)), None)
+        token_data = next((token for token in tokens_data if token["index"] == token_index), None)
         if not token_data:
             raise ValueError(f"Token with index {token_id} not found in tokens")
         
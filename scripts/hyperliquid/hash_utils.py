@@ -0,0 +1,108 @@
+import msgpack
+from Crypto.Hash import keccak
+from hyperliquid.utils.signing import action_hash, address_to_bytes
+
+# Flush the packer into the hash once its buffer grows past this size
+CHUNK_SIZE = 64 * 1024
+# Containers at most this long are packed in one call instead of being walked
+INLINE_CONTAINER_LEN = 16
+# Actions holding a list at least this long are hashed by streaming, smaller ones use the faster SDK action_hash
+STREAMING_MIN_LEN = 50_000
+
+def _iter_packed(packer, obj):
+    """
+    Pack obj into packer, walking dicts and large lists so only one chunk is buffered at a time
+
+    :param packer: msgpack.Packer created with autoreset=False
+    :param obj: Object to pack
+    :return: Generator of bytes chunks drained from packer
+    """
+    obj_type = type(obj)
+    if obj_type is dict:
+        # Small dicts may still hold a large list, e.g. {"userAndWei": [...]}
+        packer.pack_map_header(len(obj))
+        for key, value in obj.items():
+            packer.pack(key)
+            yield from _iter_packed(packer, value)
+    elif (obj_type is list or obj_type is tuple) and len(obj) > INLINE_CONTAINER_LEN:
+        packer.pack_array_header(len(obj))
+        pack = packer.pack
+        for i, item in enumerate(obj):
+            item_type = type(item)
+            if item_type is dict or ((item_type is list or item_type is tuple) and len(item) > INLINE_CONTAINER_LEN):
+                yield from _iter_packed(packer, item)
+                continue
+            pack(item)
+            # Checking the buffer size allocates a memoryview, only do it every 256 items
+            if i & 0xff == 0xff and len(packer.getbuffer()) >= CHUNK_SIZE:
+                yield packer.bytes()
+                packer.reset()
+    else:
+        packer.pack(obj)
+    if len(packer.getbuffer()) >= CHUNK_SIZE:
+        yield packer.bytes()
+        packer.reset()
+
+def iter_msgpack_chunks(obj):
+    """
+    Yield the msgpack encoding of obj in chunks of roughly CHUNK_SIZE bytes
+
+    The concatenated chunks are byte-identical to msgpack.packb(obj).
+
+    :param obj: Object to encode
+    :return: Generator of bytes chunks
+    """
+    packer = msgpack.Packer(autoreset=False)
+    yield from _iter_packed(packer, obj)
+    if len(packer.getbuffer()):
+        yield packer.bytes()
+
+def streaming_action_hash(action, vault_address, nonce, expires_after):
+    """
+    Same as hyperliquid.utils.signing.action_hash, but feeds the msgpack encoding into keccak chunk by chunk
+
+    :param action: Action object
+    :param vault_address: Vault address, usually None
+    :param nonce: Timestamp nonce
+    :param expires_after: Expiry timestamp, usually None
+    :return: 32-byte action hash
+    """
+    hasher = keccak.new(digest_bits=256)
+    for chunk in iter_msgpack_chunks(action):
+        hasher.update(chunk)
+    hasher.update(nonce.to_bytes(8, "big"))
+    if vault_address is None:
+        hasher.update(b"\x00")
+    else:
+        hasher.update(b"\x01")
+        hasher.update(address_to_bytes(vault_address))
+    if expires_after is not None:
+        hasher.update(b"\x00")
+        hasher.update(expires_after.to_bytes(8, "big"))
+    return hasher.digest()
+
+def _holds_large_list(obj):
+    """Whether obj is or contains a list/tuple of at least STREAMING_MIN_LEN items"""
+    obj_type = type(obj)
+    if obj_type is dict:
+        return any(_holds_large_list(value) for value in obj.values())
+    if obj_type is list or obj_type is tuple:
+        return len(obj) >= STREAMING_MIN_LEN or any(_holds_large_list(item) for item in obj)
+    return False
+
+def l1_action_hash(action, vault_address, nonce, expires_after):
+    """
+    Hash an L1 action, streaming the msgpack encoding only for actions holding a large list
+
+    Streaming keeps extra memory constant but is 25-40% slower than the SDK action_hash,
+    so it is only worth it for e.g. a userGenesis with hundreds of thousands of userAndWei pairs.
+
+    :param action: Action object
+    :param vault_address: Vault address, usually None
+    :param nonce: Timestamp nonce
+    :param expires_after: Expiry timestamp, usually None
+    :return: 32-byte action hash
+    """
+    if _holds_large_list(action):
+        return streaming_action_hash(action, vault_address, nonce, expires_after)
+    return action_hash(action, vault_address, nonce, expires_after)
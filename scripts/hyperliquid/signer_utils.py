@@ -0,0 +1,162 @@
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from dotenv import load_dotenv
+from eth_account import Account
+from eth_account.messages import encode_typed_data
+from eth_keys import keys
+from eth_utils import keccak, to_hex
+from ledgereth.messages import sign_typed_data_draft
+from hyperliquid.utils.signing import construct_phantom_agent, l1_payload
+from hash_utils import l1_action_hash
+
+# Load environment variables from .env file
+load_dotenv()
+
+def l1_action_digest(action, active_pool, nonce, expires_after, is_mainnet):
+    """
+    Build the EIP-712 domain and message hashes signed for an L1 action
+
+    :param action: Action object
+    :param active_pool: Vault address, usually None
+    :param nonce: Timestamp nonce
+    :param expires_after: Expiry timestamp, usually None
+    :param is_mainnet: Whether the action targets mainnet
+    :return: Tuple of (domain_hash, message_hash)
+    """
+    hash = l1_action_hash(action, active_pool, nonce, expires_after)
+    phantom_agent = construct_phantom_agent(hash, is_mainnet)
+    data = l1_payload(phantom_agent)
+    signable = encode_typed_data(full_message=data)
+    return signable.header, signable.body
+
+def to_signature(r, s, v):
+    """Format a signature the way the /exchange endpoint expects it"""
+    return {"r": to_hex(r), "s": to_hex(s), "v": v}
+
+class Signer(ABC):
+    """
+    Signs EIP-712 digests. Every backend returns signatures as {"r", "s", "v"}.
+    """
+
+    @abstractmethod
+    def sign_typed_data(self, domain_hash, message_hash):
+        """
+        Sign a single EIP-712 digest
+
+        :param domain_hash: EIP-712 domain separator hash
+        :param message_hash: EIP-712 struct hash
+        :return: Signature dict
+        """
+
+    def sign_typed_data_batch(self, digests):
+        """
+        Sign a batch of EIP-712 digests, in order
+
+        :param digests: List of (domain_hash, message_hash) tuples
+        :return: List of signature dicts
+        """
+        return [self.sign_typed_data(domain_hash, message_hash) for domain_hash, message_hash in digests]
+
+    def sign_l1_action(self, action, active_pool, nonce, expires_after, is_mainnet):
+        """
+        Sign an L1 action
+
+        :param action: Action object
+        :param active_pool: Vault address, usually None
+        :param nonce: Timestamp nonce
+        :param expires_after: Expiry timestamp, usually None
+        :param is_mainnet: Whether the action targets mainnet
+        :return: Signature dict
+        """
+        return self.sign_typed_data(*l1_action_digest(action, active_pool, nonce, expires_after, is_mainnet))
+
+    def close(self):
+        """Release any resources held by the backend"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class LedgerSigner(Signer):
+    """Signs on a Ledger device, one signature at a time"""
+
+    def __init__(self, derivation_path="44'/60'/0'/0/0"):
+        self.derivation_path = derivation_path
+
+    def sign_typed_data(self, domain_hash, message_hash):
+        signed = sign_typed_data_draft(domain_hash, message_hash, self.derivation_path)
+        return to_signature(signed.r, signed.s, signed.v)
+
+class LocalSigner(Signer):
+    """Signs in-process with a private key, for testnet and load tests"""
+
+    def __init__(self, private_key):
+        self.account = Account.from_key(private_key)
+        self.key = keys.PrivateKey(self.account.key)
+
+    @property
+    def address(self):
+        return self.account.address
+
+    def sign_typed_data(self, domain_hash, message_hash):
+        # Same digest as eth_account's sign_message for EIP-712, without building the intermediate objects
+        signed = self.key.sign_msg_hash(keccak(b"\x19\x01" + domain_hash + message_hash))
+        return to_signature(signed.r, signed.s, signed.v + 27)
+
+_worker_signer = None
+
+def _init_worker(private_key):
+    global _worker_signer
+    _worker_signer = LocalSigner(private_key)
+
+def _sign_chunk(digests):
+    return _worker_signer.sign_typed_data_batch(digests)
+
+class ProcessPoolSigner(LocalSigner):
+    """Signs batches with a private key across a pool of worker processes"""
+
+    def __init__(self, private_key, max_workers=None, chunk_size=256):
+        super().__init__(private_key)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.max_workers, initializer=_init_worker, initargs=(private_key,)
+        )
+
+    def sign_typed_data_batch(self, digests):
+        digests = list(digests)
+        # Small batches are cheaper to sign here than to ship to the workers
+        if len(digests) <= self.chunk_size:
+            return super().sign_typed_data_batch(digests)
+        chunks = [digests[i:i + self.chunk_size] for i in range(0, len(digests), self.chunk_size)]
+        signatures = []
+        for chunk_signatures in self.executor.map(_sign_chunk, chunks):
+            signatures.extend(chunk_signatures)
+        return signatures
+
+    def close(self):
+        self.executor.shutdown()
+
+def get_signer(backend, derivation_path="44'/60'/0'/0/0", private_key=None, max_workers=None):
+    """
+    Create a signer backend
+
+    :param backend: One of "ledger", "local" or "pool"
+    :param derivation_path: Derivation path on Ledger, used by the ledger backend
+    :param private_key: Private key for the software backends, defaults to PRIVATE_KEY from the environment
+    :param max_workers: Number of worker processes for the pool backend, defaults to the CPU count
+    :return: Signer
+    """
+    if backend == "ledger":
+        return LedgerSigner(derivation_path)
+    private_key = private_key or os.getenv("PRIVATE_KEY")
+    if not private_key:
+        raise ValueError("PRIVATE_KEY is not set")
+    if backend == "local":
+        return LocalSigner(private_key)
+    if backend == "pool":
+        return ProcessPoolSigner(private_key, max_workers)
+    raise ValueError(f"Unknown signer backend: {backend}")
@@ -0,0 +1,244 @@
+import codecs
+import json
+import re
+
+CHUNK_SIZE = 64 * 1024
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+WHITESPACE_CHARS = (" ", "\t", "\n", "\r")
+VALUE_END = " \t\n\r,:]}"
+# Whitespace and the separator following an array element
+ELEMENT_END = re.compile(r"[ \t\n\r]*([,\]])")
+
+def _balanced_pattern(depth):
+    """
+    Regex matching JSON text up to the next unbalanced bracket or incomplete string,
+    skipping complete strings and containers nested at most depth levels in one match
+    """
+    string = r'"[^"\\]*+(?:\\.[^"\\]*+)*+"'
+    pattern = rf'(?:[^"\[\]{{}}]++|{string})*+'
+    for _ in range(depth):
+        pattern = rf'(?:[^"\[\]{{}}]++|{string}|[\[{{]{pattern}[\]}}])*+'
+    return re.compile(pattern, re.DOTALL)
+
+# Deep enough to skip a whole spotMeta entry in one match, deeper containers are walked one bracket at a time
+SKIP_BALANCED = _balanced_pattern(4)
+
+class _JsonStream:
+    """Rolling text buffer over an iterator of bytes chunks"""
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.decoder = json.JSONDecoder()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        """Read one more chunk into the buffer, dropping consumed text. Return False at end of stream"""
+        if self.eof:
+            return False
+        chunk = next(self.chunks, None)
+        if chunk is None:
+            self.eof = True
+            text = self.utf8.decode(b"", final=True)
+        else:
+            text = self.utf8.decode(chunk)
+        self.buf = self.buf[self.pos:] + text
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Skip whitespace and return the next character, or None at end of stream"""
+        while True:
+            self.pos = WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return None
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"Malformed spotMeta response: expected {char!r}")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next JSON value, reading more chunks until it is complete"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+                # A number cut off by the end of the buffer, e.g. "1." or "1e", may continue in the next chunk
+                if (end < len(self.buf) and self.buf[end] in VALUE_END) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self.fill()
+
+    def skip_container(self):
+        """
+        Skip the JSON array or object at the current position without decoding it
+
+        Only bracket depth is tracked, so no objects are built and memory stays at one chunk.
+        The contents are not validated.
+        """
+        if self.peek() not in ("[", "{"):
+            raise ValueError("Malformed spotMeta response: expected an array or object")
+        # Start inside the container, a match from its opening bracket would run on past its end
+        self.pos += 1
+        skip = SKIP_BALANCED.match
+        depth = 1
+        while True:
+            buf = self.buf
+            pos = self.pos
+            end = len(buf)
+            while True:
+                pos = skip(buf, pos).end()
+                # Either the buffer ends or a string is cut off by it
+                if pos == end or buf[pos] == '"':
+                    break
+                # Opening brackets left here belong to a container cut off by the buffer end or nested too deep
+                depth += 1 if buf[pos] in "[{" else -1
+                pos += 1
+                if depth == 0:
+                    self.pos = pos
+                    return
+            self.pos = pos
+            if not self.fill():
+                raise ValueError("Malformed spotMeta response: unterminated array or object")
+
+    def scan_array(self, on_element):
+        """
+        Decode the elements of the JSON array at the current position one at a time
+
+        Elements already in the buffer are decoded in a tight loop, more chunks are only read at the buffer end.
+
+        Args:
+            on_element: Called with each element, returning True stops the scan
+
+        Returns:
+            True if on_element stopped the scan, False once the array is exhausted
+        """
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return False
+        # scan_once is the C scanner behind raw_decode, it raises StopIteration when the value is incomplete
+        scan_once = self.decoder.scan_once
+        match_element_end = ELEMENT_END.match
+        match_whitespace = WHITESPACE.match
+        while True:
+            # Whitespace after a separator may have spilled over into the new chunk
+            buf = self.buf
+            pos = self.pos = match_whitespace(buf, self.pos).end()
+            try:
+                while True:
+                    value, end = scan_once(buf, pos)
+                    # Fast path for compact JSON, otherwise allow whitespace around the separator
+                    separator = buf[end:end + 1]
+                    if separator == ",":
+                        pos = end + 1
+                    else:
+                        match = match_element_end(buf, end)
+                        # The element or its separator is cut off at the end of the buffer
+                        if match is None:
+                            break
+                        separator = match.group(1)
+                        pos = match.end()
+                    if separator == "]":
+                        self.pos = pos
+                        return bool(on_element(value))
+                    if buf[pos:pos + 1] in WHITESPACE_CHARS:
+                        pos = match_whitespace(buf, pos).end()
+                    self.pos = pos
+                    if on_element(value):
+                        return True
+            except (StopIteration, json.JSONDecodeError):
+                if self.eof:
+                    raise ValueError("Malformed spotMeta response: invalid array element")
+            if not self.fill():
+                raise ValueError("Malformed spotMeta response: unterminated array")
+
+def stream_spot_meta(chunks, token_indexes=(), token_ids=(), spot_indexes=(), pairs=()):
+    """
+    Incrementally decode a spotMeta response, keeping only the requested tokens and universe entries.
+
+    Entries are decoded one at a time and dropped unless they match, and decoding stops as soon as every
+    target has been found, so the rest of the body is never read.
+
+    Args:
+        chunks: Iterator of bytes chunks, e.g. response.iter_content(CHUNK_SIZE)
+        token_indexes: Token indexes to keep from "tokens"
+        token_ids: Token IDs to keep from "tokens"
+        spot_indexes: Spot indexes to keep from "universe"
+        pairs: (base, quote) token index pairs to keep from "universe"
+
+    Returns:
+        Dictionary with the matching "tokens" and "universe" entries, in response order
+    """
+    token_indexes = set(token_indexes)
+    token_ids = {token_id.lower() for token_id in token_ids}
+    spot_indexes = set(spot_indexes)
+    pairs = {tuple(pair) for pair in pairs}
+    remaining = len(token_indexes) + len(token_ids) + len(spot_indexes) + len(pairs)
+
+    matched = {"tokens": [], "universe": []}
+
+    def match_token(token):
+        nonlocal remaining
+        hits = 0
+        if token_indexes and token.get("index") in token_indexes:
+            token_indexes.discard(token["index"])
+            hits += 1
+        if token_ids and str(token.get("tokenId", "")).lower() in token_ids:
+            token_ids.discard(str(token["tokenId"]).lower())
+            hits += 1
+        if hits:
+            matched["tokens"].append(token)
+            remaining -= hits
+        return remaining == 0
+
+    def match_spot(spot):
+        nonlocal remaining
+        hits = 0
+        if spot_indexes and spot.get("index") in spot_indexes:
+            spot_indexes.discard(spot["index"])
+            hits += 1
+        if pairs and tuple(spot.get("tokens") or ()) in pairs:
+            pairs.discard(tuple(spot["tokens"]))
+            hits += 1
+        if hits:
+            matched["universe"].append(spot)
+            remaining -= hits
+        return remaining == 0
+
+    # Sections without targets are skipped rather than decoded
+    matchers = {}
+    if token_indexes or token_ids:
+        matchers["tokens"] = match_token
+    if spot_indexes or pairs:
+        matchers["universe"] = match_spot
+    if remaining == 0:
+        return matched
+
+    stream = _JsonStream(chunks)
+    stream.expect("{")
+    if stream.peek() == "}":
+        return matched
+    while True:
+        key = stream.value()
+        stream.expect(":")
+        matcher = matchers.get(key)
+        next_char = stream.peek()
+        if matcher and next_char == "[":
+            if stream.scan_array(matcher):
+                return matched
+        elif next_char in ("[", "{"):
+            stream.skip_container()
+        else:
+            stream.value()
+        if stream.peek() == "}":
+            return matched
+        stream.expect(",")
@@ -4,6 +4,7 @@ import json
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 import os
+from spot_meta_utils import CHUNK_SIZE, stream_spot_meta
 
 @dataclass
 class EvmContract:
@@ -57,10 +58,11 @@ def get_spot_meta(token_index: int, is_testnet: bool = False, log_level: str = "
     
     try:
         hyperliquid_client = HyperliquidClient(is_testnet, log_level)
-        response = hyperliquid_client.submit_hyperliquid_action("/info", action)
         
-        # Parse the response into our data structures
-        tokens_data = response.get("tokens", [])
+        # Stream the response and only decode the token we are looking for
+        with requests.post(f"{hyperliquid_client.base_url}/info", json=action, stream=True) as response:
+            response.raise_for_status()
+            tokens_data = stream_spot_meta(response.iter_content(CHUNK_SIZE), token_indexes=[token_index])["tokens"]
         
         # Find specific token by index
         token_data = next((token for token in tokens_data if token["index"] == token_index), None)
@@ -127,6 +129,24 @@ def get_hip_token_info(token_id: str, is_testnet: bool = False, log_level: str =
         print(f"Error processing response: {e}")
         raise
 
+def write_deployment(output_data: Dict[str, Any], output_path: str, pretty: bool = False) -> None:
+    """
+    Write spot metadata and genesis info to a deployment file.
+    
+    Args:
+        output_data: Combined coreSpot and genesis data
+        output_path: Destination file path
+        pretty: Whether to indent the JSON output
+    """
+    # Ensure directory exists
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    
+    # Write to file
+    with open(output_path, 'w') as f:
+        json.dump(output_data, f, indent=2 if pretty else None)
+
 def main():
     parser = argparse.ArgumentParser(description='Fetch Hyperliquid spot metadata and token genesis information')
     parser.add_argument('token_index', type=int, help='Token index to fetch spot metadata and genesis info')
@@ -197,12 +217,7 @@ def main():
             else:  # Explicit path given, use it
                 output_path = args.write
             
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            
-            # Write to file
-            with open(output_path, 'w') as f:
-                json.dump(output_data, f, indent=2 if args.pretty else None)
+            write_deployment(output_data, output_path, args.pretty)
             print(f"\nSpot metadata and genesis info for token {args.token_index} also written to {output_path}")
                 
     except Exception as e: